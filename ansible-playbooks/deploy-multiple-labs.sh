@@ -116,7 +116,9 @@ print_status "Discovering available inventory files..."
 for inventory_file in inventory/hosts-*.yml; do
     if [[ -f "$inventory_file" ]]; then
         # Extract lab ID from filename (hosts-XXXXX.yml -> prod-XXXXX)
-        lab_guid=$(basename "$inventory_file" .yml | sed 's/hosts-//')
+        lab_guid="${inventory_file##*/}"
+        lab_guid="${lab_guid%.yml}"
+        lab_guid="${lab_guid#hosts-}"
         lab_id="prod-${lab_guid}"
         LABS["$lab_id"]="$inventory_file"
         print_info "Found lab: $lab_id -> $inventory_file"
@@ -145,11 +147,21 @@ if [[ "$DRY_RUN" == "true" ]]; then
         inventory_file="${LABS[$lab_id]}"
         print_info "Would deploy lab: $lab_id using $inventory_file (phase: $PHASE)"
         
-        # Extract some info from inventory
+        # Extract some info from inventory in a single read (first match wins)
         if [[ -f "$inventory_file" ]]; then
-            bastion_host=$(grep "bastion_hostname:" "$inventory_file" | head -1 | sed 's/.*bastion_hostname: *"\([^"]*\)".*/\1/' 2>/dev/null || echo "unknown")
-            bastion_port=$(grep "bastion_port:" "$inventory_file" | head -1 | sed 's/.*bastion_port: *"\([^"]*\)".*/\1/' 2>/dev/null || echo "unknown")
-            lab_guid=$(grep "lab_guid:" "$inventory_file" | head -1 | sed 's/.*lab_guid: *"\([^"]*\)".*/\1/' 2>/dev/null || echo "unknown")
+            bastion_host=""
+            bastion_port=""
+            lab_guid=""
+            while IFS= read -r inventory_line; do
+                if [[ "$inventory_line" =~ (bastion_hostname|bastion_port|lab_guid):\ *\"([^\"]*)\" ]]; then
+                    case "${BASH_REMATCH[1]}" in
+                        bastion_hostname) [[ -n "$bastion_host" ]] || bastion_host="${BASH_REMATCH[2]}" ;;
+                        bastion_port) [[ -n "$bastion_port" ]] || bastion_port="${BASH_REMATCH[2]}" ;;
+                        lab_guid) [[ -n "$lab_guid" ]] || lab_guid="${BASH_REMATCH[2]}" ;;
+                    esac
+                    [[ -n "$bastion_host" && -n "$bastion_port" && -n "$lab_guid" ]] && break
+                fi
+            done < "$inventory_file"
             print_info "  Bastion: $bastion_host:$bastion_port"
             print_info "  GUID: $lab_guid"
         fi
@@ -167,6 +179,13 @@ else
     exit 1
 fi
 
+# Credentials are the same for every lab: read them once here instead of
+# re-parsing the credentials file in each deployment job
+registry_username=$(grep "^registry_username:" "$CREDENTIALS_FILE" | sed 's/registry_username: *["\x27]\?\([^"\x27]*\)["\x27]\?/\1/')
+registry_password=$(grep "^registry_password:" "$CREDENTIALS_FILE" | sed 's/registry_password: *["\x27]\?\([^"\x27]*\)["\x27]\?/\1/')
+rhc_username=$(grep "^rhc_username:" "$CREDENTIALS_FILE" | sed 's/rhc_username: *["\x27]\?\([^"\x27]*\)["\x27]\?/\1/')
+rhc_password=$(grep "^rhc_password:" "$CREDENTIALS_FILE" | sed 's/rhc_password: *["\x27]\?\([^"\x27]*\)["\x27]\?/\1/')
+
 # Deploy function that runs in background
 deploy_single_lab() {
     local lab_id="$1"
@@ -178,13 +197,8 @@ deploy_single_lab() {
     local temp_inventory="temp_inventory_${lab_id}.yml"
     cp "$inventory_file" "$temp_inventory"
     
-    # Inject credentials if available
+    # Inject credentials if available (read once before the jobs start)
     if [[ -f "$CREDENTIALS_FILE" ]]; then
-        local registry_username=$(grep "^registry_username:" "$CREDENTIALS_FILE" | sed 's/registry_username: *["\x27]\?\([^"\x27]*\)["\x27]\?/\1/')
-        local registry_password=$(grep "^registry_password:" "$CREDENTIALS_FILE" | sed 's/registry_password: *["\x27]\?\([^"\x27]*\)["\x27]\?/\1/')
-        local rhc_username=$(grep "^rhc_username:" "$CREDENTIALS_FILE" | sed 's/rhc_username: *["\x27]\?\([^"\x27]*\)["\x27]\?/\1/')
-        local rhc_password=$(grep "^rhc_password:" "$CREDENTIALS_FILE" | sed 's/rhc_password: *["\x27]\?\([^"\x27]*\)["\x27]\?/\1/')
-        
         if [[ -n "$registry_username" ]]; then
             sed -i "s/registry_username: \"\"/registry_username: \"$registry_username\"/" "$temp_inventory"
         fi
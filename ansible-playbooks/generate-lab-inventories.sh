@@ -33,6 +33,48 @@ print_status() {
     echo -e "${GREEN}[STATUS]${NC} $1"
 }
 
+# Buffered variants of the print functions for per-lab loops; queued
+# messages are written with a single printf by flush_messages
+MESSAGE_BUFFER=()
+
+queue_info() {
+    MESSAGE_BUFFER+=("${BLUE}[INFO]${NC} $1")
+}
+
+queue_status() {
+    MESSAGE_BUFFER+=("${GREEN}[STATUS]${NC} $1")
+}
+
+flush_messages() {
+    if [[ ${#MESSAGE_BUFFER[@]} -gt 0 ]]; then
+        printf '%b\n' "${MESSAGE_BUFFER[@]}"
+        MESSAGE_BUFFER=()
+    fi
+}
+
+# Line patterns used by parse_lab_config, defined once instead of inline per test
+readonly RE_SERVICE='^openshift-cnv\.osp-on-ocp-cnv\.([^[:space:]]+)'
+readonly RE_SSH='ssh lab-user@([^[:space:]]+) -p ([0-9]+)'
+readonly RE_SSH_PASSWORD='Enter ssh password when prompted: ([^[:space:]]+)'
+readonly RE_ADMIN_PASSWORD='User admin with password ([^[:space:]]+) is cluster admin'
+readonly RE_CONSOLE='OpenShift Console: (https://[^[:space:]]+)'
+readonly RE_DATA_LINE='^[[:space:]]*([^:]+):[[:space:]]*(.*)$'
+
+# Inventory values used when a lab config does not provide them
+declare -rA INVENTORY_DEFAULTS=(
+    ["bastion_user"]="lab-user"
+    ["rhoso_external_ip_worker_1"]="172.21.0.21"
+    ["rhoso_external_ip_worker_2"]="172.21.0.22"
+    ["rhoso_external_ip_worker_3"]="172.21.0.23"
+    ["rhoso_external_ip_bastion"]="172.21.0.50"
+)
+readonly EXTERNAL_IP_FIELDS=(
+    rhoso_external_ip_worker_1
+    rhoso_external_ip_worker_2
+    rhoso_external_ip_worker_3
+    rhoso_external_ip_bastion
+)
+
 # Usage function
 usage() {
     cat << EOF
@@ -47,6 +89,7 @@ Options:
   -o, --output-dir DIR  Output directory for inventory files (default: inventory)
   -f, --force          Overwrite existing inventory files
   -d, --dry-run        Show what would be generated without creating files
+  -j, --max-parallel N Maximum number of inventory files generated in parallel (default: 1)
   -h, --help           Show this help message
 
 Examples:
@@ -54,6 +97,7 @@ Examples:
   $0 my_labs_to_be_deployed --output-dir /tmp/inventories
   $0 my_labs_to_be_deployed --dry-run
   $0 my_labs_to_be_deployed --force
+  $0 my_labs_to_be_deployed --max-parallel 8
 
 Output:
   Creates hosts-{guid}.yml files in the inventory directory for each lab found.
@@ -61,14 +105,23 @@ EOF
 }
 
 # Parse lab configuration file (reuse logic from deploy-multiple-labs.sh)
+# The number of labs found is stored in the variable named by $3, so the
+# parser runs in the calling shell instead of a command substitution
 parse_lab_config() {
     local config_file="$1"
     local temp_dir="$2"
-    local lab_count=0
+    local -n parsed_lab_count="$3"
+    parsed_lab_count=0
     local current_lab=""
     local lab_config_file=""
+    # Each lab config is written through one descriptor kept open while the
+    # lab is parsed, instead of reopening the file for every line
+    local lab_config_fd
     local in_data_section=false
     local skip_next_line=false
+    # The input is plain ASCII; matching it byte-wise avoids multibyte
+    # locale handling in read and [[ =~ ]] for every line
+    local LC_ALL=C
 
     mkdir -p "$temp_dir/lab_configs"
 
@@ -82,16 +135,18 @@ parse_lab_config() {
             continue
         fi
 
-        # Check for "Data" section header
-        if [[ "$line" =~ ^Data ]]; then
+        # Check for "Data" section header (plain prefix match, no regex needed)
+        if [[ "$line" == Data* ]]; then
             in_data_section=true
             continue
         fi
 
         # Check for service name (lab identifier)
-        if [[ "$line" =~ ^openshift-cnv\.osp-on-ocp-cnv\.([^[:space:]]+) ]]; then
-            local service_suffix="${BASH_REMATCH[1]}"
-            service_suffix=$(echo "$service_suffix" | sed 's/[[:space:]]*$//' | sed 's/[^a-zA-Z0-9-]//g')
+        # The prefix glob is cheap and skips compiling RE_SERVICE for other lines
+        if [[ "$line" == openshift-cnv.osp-on-ocp-cnv.* && "$line" =~ $RE_SERVICE ]]; then
+            # Strip anything outside [a-zA-Z0-9-] (e.g. the trailing ':' of the
+            # data section key) in-shell rather than through two sed processes
+            local service_suffix="${BASH_REMATCH[1]//[^a-zA-Z0-9-]/}"
 
             # Handle the special case where "prod:" appears in the YAML data section
             # This indicates we're in the data section for the current lab
@@ -102,9 +157,10 @@ parse_lab_config() {
 
             # Save previous lab if exists and it's valid
             if [[ -n "$current_lab" && -n "$lab_config_file" ]]; then
-                echo ")" >> "$lab_config_file"
-                ((lab_count++))
-                print_info "Completed parsing lab: $current_lab" >&2
+                echo ")" >&"$lab_config_fd"
+                exec {lab_config_fd}>&-
+                parsed_lab_count=$((parsed_lab_count + 1))
+                queue_info "Completed parsing lab: $current_lab"
             fi
 
             # Start new lab
@@ -112,48 +168,49 @@ parse_lab_config() {
             lab_config_file="$temp_dir/lab_configs/lab_${current_lab}.conf"
             in_data_section=false
 
-            print_status "Found lab: $current_lab" >&2
-            echo "LAB_ID=\"$current_lab\"" > "$lab_config_file"
-            echo "declare -A LAB_CONFIG=(" >> "$lab_config_file"
+            queue_status "Found lab: $current_lab"
+            exec {lab_config_fd}>"$lab_config_file"
+            echo "LAB_ID=\"$current_lab\"" >&"$lab_config_fd"
+            echo "declare -A LAB_CONFIG=(" >&"$lab_config_fd"
             continue
         fi
 
         # Parse SSH connection info from text
-        if [[ "$line" =~ ssh\ lab-user@([^[:space:]]+)\ -p\ ([0-9]+) ]]; then
+        if [[ "$line" =~ $RE_SSH ]]; then
             local bastion_host="${BASH_REMATCH[1]}"
             local bastion_port="${BASH_REMATCH[2]}"
             if [[ -n "$lab_config_file" && "$current_lab" != "prod" ]]; then
-                echo "  [\"bastion_hostname\"]=\"$bastion_host\"" >> "$lab_config_file"
-                echo "  [\"bastion_port\"]=\"$bastion_port\"" >> "$lab_config_file"
-                echo "  [\"bastion_user\"]=\"lab-user\"" >> "$lab_config_file"
-                print_info "  SSH: lab-user@$bastion_host:$bastion_port" >&2
+                echo "  [\"bastion_hostname\"]=\"$bastion_host\"" >&"$lab_config_fd"
+                echo "  [\"bastion_port\"]=\"$bastion_port\"" >&"$lab_config_fd"
+                echo "  [\"bastion_user\"]=\"lab-user\"" >&"$lab_config_fd"
+                queue_info "  SSH: lab-user@$bastion_host:$bastion_port"
             fi
             continue
         fi
 
         # Parse SSH password
-        if [[ "$line" =~ Enter\ ssh\ password\ when\ prompted:\ ([^[:space:]]+) ]]; then
+        if [[ "$line" =~ $RE_SSH_PASSWORD ]]; then
             local bastion_password="${BASH_REMATCH[1]}"
             if [[ -n "$lab_config_file" && "$current_lab" != "prod" ]]; then
-                echo "  [\"bastion_password\"]=\"$bastion_password\"" >> "$lab_config_file"
-                print_info "  Password: ***" >&2
+                echo "  [\"bastion_password\"]=\"$bastion_password\"" >&"$lab_config_fd"
+                queue_info "  Password: ***"
             fi
             continue
         fi
 
         # Skip admin password and console URL extraction as they're not used in playbooks
-        if [[ "$line" =~ User\ admin\ with\ password\ ([^[:space:]]+)\ is\ cluster\ admin ]]; then
-            print_info "  Admin Password: *** (not used in playbooks)" >&2
+        if [[ "$line" =~ $RE_ADMIN_PASSWORD ]]; then
+            queue_info "  Admin Password: *** (not used in playbooks)"
             continue
         fi
 
-        if [[ "$line" =~ OpenShift\ Console:\ (https://[^[:space:]]+) ]]; then
-            print_info "  Console URL: ${BASH_REMATCH[1]} (not used in playbooks)" >&2
+        if [[ "$line" =~ $RE_CONSOLE ]]; then
+            queue_info "  Console URL: ${BASH_REMATCH[1]} (not used in playbooks)"
             continue
         fi
 
         # Parse data section (YAML-like format)
-        if [[ "$in_data_section" == "true" && "$line" =~ ^[[:space:]]*([^:]+):[[:space:]]*(.*)$ ]]; then
+        if [[ "$in_data_section" == "true" && "$line" =~ $RE_DATA_LINE ]]; then
             local key="${BASH_REMATCH[1]// /_}"
             local value="${BASH_REMATCH[2]}"
 
@@ -163,23 +220,35 @@ parse_lab_config() {
                 continue
             fi
 
-            # Clean up value
-            value=$(echo "$value" | sed 's/^["\x27]\|["\x27]$//g' | sed 's/^[[:space:]]*\|[[:space:]]*$//g')
+            # Clean up value: drop one surrounding quote on each side, then trim
+            # whitespace, without spawning sed for every data line
+            value="${value#[\"\']}"
+            value="${value%[\"\']}"
+            value="${value#"${value%%[![:space:]]*}"}"
+            value="${value%"${value##*[![:space:]]}"}"
 
             if [[ -n "$lab_config_file" && -n "$value" && "$value" != ">" && "$current_lab" != "prod" ]]; then
-                echo "  [\"$key\"]=\"$value\"" >> "$lab_config_file"
-                print_info "  Data: $key = $value" >&2
+                echo "  [\"$key\"]=\"$value\"" >&"$lab_config_fd"
+                # Keep credentials out of the log, as for the SSH/admin passwords
+                if [[ "$key" == *password* ]]; then
+                    queue_info "  Data: $key = ***"
+                else
+                    queue_info "  Data: $key = $value"
+                fi
             fi
             continue
         fi
 
-        # Parse external IP variables (only from export lines to avoid duplicates)
-        if [[ "$line" =~ ^export\ EXTERNAL_IP_([^=]+)=(.+) ]]; then
-            local ip_type="${BASH_REMATCH[1],,}"
-            local ip_value="${BASH_REMATCH[2]}"
+        # Parse external IP variables (only from export lines to avoid duplicates).
+        # KEY=VALUE is split at the first '=' with parameter expansion.
+        if [[ "$line" == "export EXTERNAL_IP_"[!=]*=?* ]]; then
+            local ip_assignment="${line#export EXTERNAL_IP_}"
+            local ip_type="${ip_assignment%%=*}"
+            local ip_value="${ip_assignment#*=}"
+            ip_type="${ip_type,,}"
             if [[ -n "$lab_config_file" && "$current_lab" != "prod" ]]; then
-                echo "  [\"rhoso_external_ip_${ip_type}\"]=\"$ip_value\"" >> "$lab_config_file"
-                print_info "  External IP ${ip_type}: $ip_value" >&2
+                echo "  [\"rhoso_external_ip_${ip_type}\"]=\"$ip_value\"" >&"$lab_config_fd"
+                queue_info "  External IP ${ip_type}: $ip_value"
             fi
             continue
         fi
@@ -188,12 +257,13 @@ parse_lab_config() {
 
     # Save the last lab if it's valid
     if [[ -n "$current_lab" && -n "$lab_config_file" && "$current_lab" != "prod" ]]; then
-        echo ")" >> "$lab_config_file"
-        ((lab_count++))
-        print_info "Completed parsing lab: $current_lab" >&2
+        echo ")" >&"$lab_config_fd"
+        exec {lab_config_fd}>&-
+        parsed_lab_count=$((parsed_lab_count + 1))
+        queue_info "Completed parsing lab: $current_lab"
     fi
 
-    echo "$lab_count"
+    flush_messages >&2
 }
 
 # Generate inventory file for a lab
@@ -202,43 +272,62 @@ generate_inventory_file() {
     local output_dir="$2"
     local dry_run="$3"
     local force="$4"
+    local generated_on="$5"
+
+    # Parse the lab configuration file directly instead of sourcing it.
+    # A single pass collects every key (first match wins to avoid duplicates)
+    # rather than running a grep | head | sed pipeline per field. Values are
+    # taken up to the closing quote of the line, so an embedded '"' is kept
+    # (and rejected below for the password) instead of truncating the value.
+    local lab_id=""
+    local -A conf=()
+    local conf_line
+    while IFS= read -r conf_line; do
+        if [[ "$conf_line" =~ ^LAB_ID=\"([^\"]*)\" ]]; then
+            lab_id="${BASH_REMATCH[1]}"
+        elif [[ "$conf_line" =~ ^[[:space:]]*\[\"([^\"]+)\"\]=\"(.*)\"$ ]]; then
+            [[ -v conf["${BASH_REMATCH[1]}"] ]] || conf["${BASH_REMATCH[1]}"]="${BASH_REMATCH[2]}"
+        fi
+    done < "$lab_config_file"
+
+    # If an external IP is not found, try the alternative field name (the
+    # parsing might use different case), then fall back to INVENTORY_DEFAULTS
+    local field suffix
+    for field in "${EXTERNAL_IP_FIELDS[@]}"; do
+        if [[ -z "${conf[$field]:-}" ]]; then
+            suffix="${field#rhoso_external_ip_}"
+            conf[$field]="${conf[rhoso_external_ip_${suffix^^}]:-}"
+        fi
+    done
+    for field in "${!INVENTORY_DEFAULTS[@]}"; do
+        if [[ -z "${conf[$field]:-}" ]]; then
+            conf[$field]="${INVENTORY_DEFAULTS[$field]}"
+        fi
+    done
 
-    # Parse the lab configuration file directly instead of sourcing it
-    local lab_id=$(grep "LAB_ID=" "$lab_config_file" | cut -d'"' -f2)
-    
-    # Extract values from the config file using grep and sed (take first match only to avoid duplicates)
-    local bastion_hostname=$(grep '\["bastion_hostname"\]' "$lab_config_file" | head -1 | sed 's/.*="\([^"]*\)".*/\1/')
-    local bastion_port=$(grep '\["bastion_port"\]' "$lab_config_file" | head -1 | sed 's/.*="\([^"]*\)".*/\1/')
-    local bastion_user=$(grep '\["bastion_user"\]' "$lab_config_file" | head -1 | sed 's/.*="\([^"]*\)".*/\1/')
-    local bastion_password=$(grep '\["bastion_password"\]' "$lab_config_file" | head -1 | sed 's/.*="\([^"]*\)".*/\1/')
-    local guid=$(grep '\["guid"\]' "$lab_config_file" | head -1 | sed 's/.*="\([^"]*\)".*/\1/')
+    local bastion_hostname="${conf[bastion_hostname]:-}"
+    local bastion_port="${conf[bastion_port]:-}"
+    local bastion_user="${conf[bastion_user]}"
+    local bastion_password="${conf[bastion_password]:-}"
     # If guid is empty, use lab_id as fallback
-    if [[ -z "$guid" ]]; then
-        guid="$lab_id"
-    fi
-    # Try to extract external IPs from the parsed config, with correct field names (take first match only)
-    local rhoso_external_ip_worker_1=$(grep '\["rhoso_external_ip_worker_1"\]' "$lab_config_file" | head -1 | sed 's/.*="\([^"]*\)".*/\1/')
-    local rhoso_external_ip_worker_2=$(grep '\["rhoso_external_ip_worker_2"\]' "$lab_config_file" | head -1 | sed 's/.*="\([^"]*\)".*/\1/')
-    local rhoso_external_ip_worker_3=$(grep '\["rhoso_external_ip_worker_3"\]' "$lab_config_file" | head -1 | sed 's/.*="\([^"]*\)".*/\1/')
-    local rhoso_external_ip_bastion=$(grep '\["rhoso_external_ip_bastion"\]' "$lab_config_file" | head -1 | sed 's/.*="\([^"]*\)".*/\1/')
-    
-    # If not found, try alternative field names (the parsing might use different case)
-    [[ -z "$rhoso_external_ip_worker_1" ]] && rhoso_external_ip_worker_1=$(grep '\["rhoso_external_ip_WORKER_1"\]' "$lab_config_file" | head -1 | sed 's/.*="\([^"]*\)".*/\1/')
-    [[ -z "$rhoso_external_ip_worker_2" ]] && rhoso_external_ip_worker_2=$(grep '\["rhoso_external_ip_WORKER_2"\]' "$lab_config_file" | head -1 | sed 's/.*="\([^"]*\)".*/\1/')
-    [[ -z "$rhoso_external_ip_worker_3" ]] && rhoso_external_ip_worker_3=$(grep '\["rhoso_external_ip_WORKER_3"\]' "$lab_config_file" | head -1 | sed 's/.*="\([^"]*\)".*/\1/')
-    [[ -z "$rhoso_external_ip_bastion" ]] && rhoso_external_ip_bastion=$(grep '\["rhoso_external_ip_BASTION"\]' "$lab_config_file" | head -1 | sed 's/.*="\([^"]*\)".*/\1/')
-    
-    # Use defaults if values are empty
-    [[ -z "$guid" ]] && guid="$lab_id"
-    [[ -z "$bastion_user" ]] && bastion_user="lab-user"
-    [[ -z "$rhoso_external_ip_worker_1" ]] && rhoso_external_ip_worker_1="172.21.0.21"
-    [[ -z "$rhoso_external_ip_worker_2" ]] && rhoso_external_ip_worker_2="172.21.0.22"
-    [[ -z "$rhoso_external_ip_worker_3" ]] && rhoso_external_ip_worker_3="172.21.0.23"
-    [[ -z "$rhoso_external_ip_bastion" ]] && rhoso_external_ip_bastion="172.21.0.50"
+    local guid="${conf[guid]:-$lab_id}"
+    local rhoso_external_ip_worker_1="${conf[rhoso_external_ip_worker_1]}"
+    local rhoso_external_ip_worker_2="${conf[rhoso_external_ip_worker_2]}"
+    local rhoso_external_ip_worker_3="${conf[rhoso_external_ip_worker_3]}"
+    local rhoso_external_ip_bastion="${conf[rhoso_external_ip_bastion]}"
     
     # Create output filename
     local output_file="$output_dir/hosts-${guid}.yml"
     
+    # The password is written raw into double-quoted YAML scalars that
+    # deploy-via-jumphost.sh and test-bastion-connectivity.sh read back with
+    # grep | sed, and into a single-quoted ProxyCommand run by /bin/sh, so
+    # backslashes and quotes cannot be represented safely
+    if [[ "$bastion_password" == *[\\\"\']* ]]; then
+        print_error "Lab $lab_id: bastion password contains an unsupported character (\\, \" or '); not generating $output_file"
+        return 1
+    fi
+    
     # Check if file exists and force is not set
     if [[ -f "$output_file" && "$force" != "true" ]]; then
         print_warning "File $output_file already exists. Use --force to overwrite."
@@ -255,12 +344,13 @@ generate_inventory_file() {
     
     print_status "Generating inventory for lab: $lab_id (GUID: $guid)"
     
-    # Generate the inventory file
-    cat > "$output_file" << EOF
+    # Render the inventory with builtins only (no cat process per lab)
+    local inventory_content
+    IFS= read -r -d '' inventory_content << EOF || true
 ---
 # Ansible inventory for RHOSO deployment via SSH jump host (bastion)
 # Generated for Lab: $lab_id (GUID: $guid)
-# Generated on: $(date)
+# Generated on: $generated_on
 
 all:
   vars:
@@ -322,16 +412,69 @@ compute_nodes:
       ansible_ssh_common_args: '-o ProxyCommand="sshpass -p $bastion_password ssh -W %h:%p -p $bastion_port $bastion_user@$bastion_hostname"'
 EOF
     
+    # Without --force, create the file with noclobber so that parallel jobs
+    # resolving to the same GUID cannot both write it after the check above
+    if [[ "$force" != "true" ]]; then
+        local -
+        set -C
+    fi
+    # Capture the redirection error so only the noclobber collision is quiet
+    local write_error
+    if ! write_error=$( { printf '%s' "$inventory_content" > "$output_file"; } 2>&1 ); then
+        if [[ -f "$output_file" && "$force" != "true" ]]; then
+            print_warning "File $output_file already exists. Use --force to overwrite."
+            return 2
+        fi
+        print_error "Failed to write inventory file: $output_file (${write_error:-unknown error})"
+        return 1
+    fi
     print_success "Created inventory file: $output_file"
     return 0
 }
 
+# Count and report the generate_inventory_file result for one lab config.
+# $3 and $4 name the caller's success and skip counters.
+record_generation_result() {
+    local config_file="$1"
+    local exit_code="$2"
+    local -n success_total="$3"
+    local -n skip_total="$4"
+
+    print_info "DEBUG: generate_inventory_file returned exit code $exit_code for: $config_file"
+
+    if [[ $exit_code -eq 0 ]]; then
+        success_total=$((success_total + 1))
+        print_info "DEBUG: Success count incremented to: $success_total ($config_file)"
+    elif [[ $exit_code -eq 2 ]]; then
+        skip_total=$((skip_total + 1))
+        print_info "DEBUG: Skip count incremented to: $skip_total (file already exists: $config_file)"
+    else
+        skip_total=$((skip_total + 1))
+        print_error "DEBUG: Error processing $config_file (exit code: $exit_code)"
+    fi
+}
+
+# Wait for a background generation job, replay its captured output in one
+# piece and record its result. $4 and $5 name the caller's counters.
+finish_generation_job() {
+    local pid="$1"
+    local config_file="$2"
+    local job_log="$3"
+    local exit_code=0
+
+    wait "$pid" || exit_code=$?
+    cat "$job_log.out"
+    cat "$job_log.err" >&2
+    record_generation_result "$config_file" "$exit_code" "$4" "$5"
+}
+
 # Main function
 main() {
     local labs_config_file=""
     local output_dir="inventory"
     local force="false"
     local dry_run="false"
+    local max_parallel=1
     
     # Parse command line arguments
     while [[ $# -gt 0 ]]; do
@@ -348,6 +491,10 @@ main() {
                 dry_run="true"
                 shift
                 ;;
+            -j|--max-parallel)
+                max_parallel="$2"
+                shift 2
+                ;;
             -h|--help)
                 usage
                 exit 0
@@ -382,6 +529,12 @@ main() {
         exit 1
     fi
     
+    if [[ ! "$max_parallel" =~ ^[1-9][0-9]*$ ]]; then
+        print_error "Invalid value for --max-parallel: $max_parallel"
+        usage
+        exit 1
+    fi
+    
     # Create output directory if it doesn't exist
     if [[ "$dry_run" != "true" ]]; then
         mkdir -p "$output_dir"
@@ -393,13 +546,19 @@ main() {
     print_info "Output directory: $output_dir"
     print_info "Force overwrite: $force"
     print_info "Dry run: $dry_run"
+    print_info "Max parallel: $max_parallel"
     
+    # Timestamp shared by every inventory generated in this run
+    local generated_on
+    generated_on=$(date)
+
     # Create temporary directory for parsing
     local temp_dir=$(mktemp -d)
     trap "rm -rf $temp_dir" EXIT
     
     print_status "Parsing lab configuration..."
-    local lab_count=$(parse_lab_config "$labs_config_file" "$temp_dir")
+    local lab_count
+    parse_lab_config "$labs_config_file" "$temp_dir" lab_count
     
     if [[ "$lab_count" -eq 0 ]]; then
         print_error "No valid labs found in configuration file"
@@ -413,33 +572,54 @@ main() {
     local skip_count=0
     
     print_info "DEBUG: Looking for config files in: $temp_dir/lab_configs/"
-    print_info "DEBUG: Config files found: $(ls -1 "$temp_dir"/lab_configs/lab_*.conf 2>/dev/null | wc -l)"
+    # Expand the glob once and reuse it for both the count and the loop
+    local -a config_files=("$temp_dir"/lab_configs/lab_*.conf)
+    print_info "DEBUG: Config files found: ${#config_files[@]}"
     
-    for config_file in "$temp_dir"/lab_configs/lab_*.conf; do
+    # With --max-parallel > 1 each lab is generated in a background job, at
+    # most $max_parallel at a time, with its output kept in a per-job log and
+    # replayed in launch order; otherwise it runs in the foreground
+    local -a job_pids=()
+    local -a job_configs=()
+    local next_job=0
+    local job_log_dir="$temp_dir/jobs"
+    mkdir -p "$job_log_dir"
+
+    for config_file in "${config_files[@]}"; do
         if [[ -f "$config_file" ]]; then
             print_info "DEBUG: Processing config file: $config_file"
-            # Temporarily disable exit on error for this function call
-            set +e
-            generate_inventory_file "$config_file" "$output_dir" "$dry_run" "$force"
-            local exit_code=$?
-            set -e
-            
-            print_info "DEBUG: generate_inventory_file returned exit code: $exit_code"
-            
-            if [[ $exit_code -eq 0 ]]; then
-                ((success_count++))
-                print_info "DEBUG: Success count incremented to: $success_count"
-            elif [[ $exit_code -eq 2 ]]; then
-                ((skip_count++))
-                print_info "DEBUG: Skip count incremented to: $skip_count (file already exists)"
-            else
-                ((skip_count++))
-                print_error "DEBUG: Error processing $config_file (exit code: $exit_code)"
+            if [[ "$max_parallel" -eq 1 ]]; then
+                # Temporarily disable exit on error for this function call
+                set +e
+                generate_inventory_file "$config_file" "$output_dir" "$dry_run" "$force" "$generated_on"
+                local exit_code=$?
+                set -e
+                record_generation_result "$config_file" "$exit_code" success_count skip_count
+                continue
             fi
+
+            # Wait for the oldest running job once the parallel limit is reached
+            if [[ $(( ${#job_pids[@]} - next_job )) -ge "$max_parallel" ]]; then
+                finish_generation_job "${job_pids[$next_job]}" "${job_configs[$next_job]}" \
+                    "$job_log_dir/job_${next_job}" success_count skip_count
+                next_job=$((next_job + 1))
+            fi
+
+            # Disable exit on error inside the job, as for a foreground call
+            { set +e; generate_inventory_file "$config_file" "$output_dir" "$dry_run" "$force" "$generated_on"; } \
+                > "$job_log_dir/job_${#job_pids[@]}.out" 2> "$job_log_dir/job_${#job_pids[@]}.err" &
+            job_pids+=("$!")
+            job_configs+=("$config_file")
         else
             print_info "DEBUG: Config file not found or not readable: $config_file"
         fi
     done
+
+    while [[ "$next_job" -lt "${#job_pids[@]}" ]]; do
+        finish_generation_job "${job_pids[$next_job]}" "${job_configs[$next_job]}" \
+            "$job_log_dir/job_${next_job}" success_count skip_count
+        next_job=$((next_job + 1))
+    done
     
     print_info "DEBUG: Final counts - Success: $success_count, Skip: $skip_count"
     
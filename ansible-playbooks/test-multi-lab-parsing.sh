@@ -194,7 +194,9 @@ main() {
     # Show the generated configuration files
     for config_file in "$temp_dir"/lab_configs/lab_*.conf; do
         if [[ -f "$config_file" ]]; then
-            local lab_id=$(basename "$config_file" .conf | sed 's/^lab_//')
+            local lab_id="${config_file##*/}"
+            lab_id="${lab_id%.conf}"
+            lab_id="${lab_id#lab_}"
             print_info "Configuration file: lab_${lab_id}.conf"
             echo "----------------------------------------"
             cat "$config_file"